@@ -4,39 +4,57 @@
 from __future__ import annotations
 import sys
 import os
+import codecs
+import functools
+import hashlib
 import json
+import shutil
+from collections.abc import Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
+try:
+    import orjson  # Optional: much faster state autosaves when installed
+except ImportError:
+    orjson = None
+
 # =========================
 # ✅ Config: extensions / exclude rules (hard-coded)
 # =========================
 
+# Lookup sets below are hit per file while scanning, so they are frozen and
+# their strings interned once at import.
+
 # ✅ Allowed extensions (lowercase, without dot)
 # C# uses `.cs`. There's no such thing as ".c#". Damn.
-ALLOWED_EXTS = {
+ALLOWED_EXTS = frozenset(map(sys.intern, (
     "py", "sql",
     "html", "css", "js",
     "c", "h",
     "cpp", "hpp", "cc", "hh",
     "cs",
-}
+)))
 
 # ✅ Default excluded directories (hard-coded)
-EXCLUDE_DIRS = {
+EXCLUDE_DIRS = frozenset(map(sys.intern, (
     ".git", ".svn", ".hg",
     "__pycache__", ".pytest_cache",
     "node_modules",
     "venv", ".venv",
     "dist", "build",
     ".idea", ".vscode",
-}
+)))
 
 # =========================
 # ✅ Generated files / state files
 # =========================
 BUNDLE_NAME = "bundle.txt"
 STATE_FILE = "bundle_state.json"
-EXCLUDE_FILES = {BUNDLE_NAME, STATE_FILE}
+STATE_JOURNAL = "bundle_state.jsonl"  # Per-change deltas on top of STATE_FILE
+STATE_JOURNAL_MAX_BYTES = 4 * 1024 * 1024  # Fold the journal into STATE_FILE past this size
+STATE_SHARD_DIR = "bundle_state.d"  # Captured contents, one file per path (see write_state_shard)
+SCAN_CACHE_FILE = "bundle_scan_cache.json"  # Last scan result, reused while no scanned dir changed
+EXCLUDE_FILES = frozenset(map(sys.intern, (BUNDLE_NAME, STATE_FILE, STATE_JOURNAL, SCAN_CACHE_FILE)))
 
 # =========================
 # ✅ Output format
@@ -60,16 +78,23 @@ MODES = (MODE_HYBRID, MODE_PASTE, MODE_AUTO)
 # ✅ auto-read safety guards (hard-coded)
 # =========================
 AUTO_MAX_BYTES = 5 * 1024 * 1024  # Skip files larger than 5MB (bundle hell prevention)
-AUTO_ENCODINGS = ("utf-8", "utf-8-sig", "cp949")
+AUTO_FALLBACK_ENCODINGS = ("cp949",)  # Tried after ASCII / UTF-8 (with or without BOM)
+# Scanned files already passed ALLOWED_EXTS (text sources only), so the NULL-byte
+# binary scan is opt-in. Pure-ASCII buffers (e.g. BOM-less UTF-16 of ASCII text)
+# are always checked. Set to True to check every buffer anyway.
+AUTO_STRICT_BINARY_CHECK = False
+AUTO_READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)  # Parallel reads in AUTO mode
+AUTO_READ_BATCH = 64  # Max files handed to a worker per submit in AUTO mode
+AUTO_PREFETCH_DEPTH = 4  # Files a worker hints to the kernel ahead of the one it's reading
 
 # Optional: names/extensions to skip in auto-read (for secrets / noise)
-AUTO_SKIP_NAMES = {
+AUTO_SKIP_NAMES = frozenset(map(sys.intern, (
     ".env", ".env.local", ".env.production", ".env.development",
     "id_rsa", "id_dsa", "id_ed25519",
-}
-AUTO_SKIP_EXTS = {
+)))
+AUTO_SKIP_EXTS = frozenset(map(sys.intern, (
     "pem", "key", "p12", "pfx", "der", "crt", "cer",
-}
+)))
 
 # =========================
 # ✅ ANSI colors
@@ -101,10 +126,14 @@ def color(text: str, *styles: str) -> str:
     return "".join(styles) + text + RESET
 
 
+# Memoized: _to_posix serves the per-file relpath() fallback in generate_files,
+# _from_posix every shard read/write; both see the same paths repeatedly.
+@functools.lru_cache(maxsize=8192)
 def _to_posix(path: str) -> str:
     return path.replace(os.sep, "/")
 
 
+@functools.lru_cache(maxsize=8192)
 def _from_posix(path: str) -> str:
     return path.replace("/", os.sep)
 
@@ -258,42 +287,206 @@ def compute_rel_root(base_dirs_abs: list[str]) -> str:
         return os.getcwd()
 
 
-def generate_files(base_dirs_abs: list[str]) -> list[str]:
+def _mtime_ns(path: str) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _is_own_output(name: str) -> bool:
+    # Our generated files, their atomic-write temp files, and the shard dir.
+    return name == STATE_SHARD_DIR or name.partition(".tmp.")[0] in EXCLUDE_FILES
+
+
+def _path_stamp(path: str, own_dir: str) -> int | list[str] | None:
     """
-    Walk given base directories and collect all allowed files
-    as POSIX-style relative paths from rel_root.
+    Change stamp of a scanned dir or file root: its mtime_ns (None if it
+    can't be stat'ed). The folder BundleMaker writes its outputs into (cwd)
+    has its mtime bumped by those writes on every run, so it is stamped by
+    the sorted names of its other entries instead.
     """
-    out: set[str] = set()
+    if os.path.normcase(path) == os.path.normcase(own_dir):
+        try:
+            return sorted(n for n in os.listdir(path) if not _is_own_output(n))
+        except OSError:
+            return None
+    return _mtime_ns(path)
+
+
+def _scan_cache_key(base_dirs_abs: list[str], rel_root: str) -> dict[str, object]:
+    # The selection rules are part of the key: editing them must invalidate the cache.
+    return {
+        "scan_dirs_abs": base_dirs_abs,
+        "rel_root": rel_root,
+        "rules": [sorted(ALLOWED_EXTS), sorted(EXCLUDE_DIRS), sorted(EXCLUDE_FILES)],
+    }
+
+
+def load_scan_cache(base_dirs_abs: list[str], rel_root: str) -> list[tuple[str, str, int]] | None:
+    """
+    Return the cached generate_files() result if it was made for the same
+    roots and rules and no scanned directory (or file root) changed its
+    stamp since (see _path_stamp). A directory's mtime changes whenever an
+    entry is added, removed or renamed in it, so matching stamps mean the
+    file list is still valid.
+    Sizes may be stale; auto_read_file() re-checks what it actually reads.
+    """
+    if not os.path.exists(SCAN_CACHE_FILE):
+        return None
+    try:
+        with open(SCAN_CACHE_FILE, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+
+        if cache.get("key") != _scan_cache_key(base_dirs_abs, rel_root):
+            return None
+        own_dir = os.getcwd()
+        for path, stamp in cache["stamps"]:
+            if _path_stamp(path, own_dir) != stamp:
+                return None
+        return [(rel, abs_fp, size) for rel, abs_fp, size in cache["files"]]
+    except Exception:
+        return None
+
+
+def save_scan_cache(
+    base_dirs_abs: list[str],
+    rel_root: str,
+    stamps: list[tuple[str, int | list[str] | None]],
+    files: list[tuple[str, str, int]],
+) -> None:
+    cache = {
+        "key": _scan_cache_key(base_dirs_abs, rel_root),
+        "stamps": stamps,
+        "files": files,
+    }
+    try:
+        atomic_write_json(SCAN_CACHE_FILE, cache)
+    except (OSError, TypeError, ValueError):
+        # The cache is only an optimization: skip it on a read-only cwd, or when
+        # a path isn't valid UTF-8 (undecodable filename bytes) and won't encode.
+        pass
+
+
+def generate_files(base_dirs_abs: list[str], use_cache: bool = True) -> list[tuple[str, str, int]]:
+    """
+    Walk given base directories and collect all allowed files.
+
+    Returns (rel_posix, abs_path, size) tuples sorted by rel_posix, where
+    rel_posix is the POSIX-style path relative to rel_root and size comes
+    from the stat scandir already cached (0 if it couldn't be stat'ed).
+
+    With use_cache, an unchanged tree is served from SCAN_CACHE_FILE
+    (see load_scan_cache) and a fresh walk refreshes it.
+    """
+    out: dict[str, tuple[str, str, int]] = {}
     rel_root = compute_rel_root(base_dirs_abs)
 
-    def allow_file(fp: str) -> bool:
-        name = os.path.basename(fp)
-        if name in EXCLUDE_FILES:
+    if use_cache:
+        cached = load_scan_cache(base_dirs_abs, rel_root)
+        if cached is not None:
+            return cached
+
+    # (path, _path_stamp) of every scanned dir and file root, for the scan cache.
+    stamps: list[tuple[str, int | list[str] | None]] = []
+    own_dir = os.getcwd()
+    # Only the shard dir we write (in cwd) is pruned, not user dirs of that name.
+    own_shard_dir = os.path.normcase(os.path.join(own_dir, STATE_SHARD_DIR))
+
+    # Everything we discover normally lives under rel_root, so its relative
+    # path is just a slice; relpath() is only the fallback (e.g. rel_root fell
+    # back to cwd because the roots are on different drives).
+    rel_prefix = rel_root if rel_root.endswith(os.sep) else rel_root + os.sep
+    prefix_len = len(rel_prefix)
+
+    def rel_posix(abs_path: str) -> str:
+        if abs_path.startswith(rel_prefix):
+            return abs_path[prefix_len:].replace(os.sep, "/")
+        return _to_posix(os.path.relpath(abs_path, rel_root))
+
+    # The frozen, interned lookup sets, bound once for the per-entry checks below.
+    exclude_dirs = EXCLUDE_DIRS
+    exclude_files = EXCLUDE_FILES
+    allowed_exts = ALLOWED_EXTS
+
+    def allow_file(name: str) -> bool:
+        if name in exclude_files:
             return False
         if ".tmp." in name:
             return False
-        ext = os.path.splitext(name)[1].lower().lstrip(".")
-        return bool(ext) and ext in ALLOWED_EXTS
+        # dot > 0: like splitext(), a leading-dot name ('.py') has no extension.
+        dot = name.rfind(".")
+        return dot > 0 and name[dot + 1:].lower() in allowed_exts
+
+    def _scan(dirpath: str) -> None:
+        # One scandir pass per directory: DirEntry gives us the name and the
+        # file type (d_type) for free, so pruning never needs a stat().
+        # Stamp before listing: a change during the walk then invalidates the cache.
+        stamps.append((dirpath, _path_stamp(dirpath, own_dir)))
+        try:
+            it = os.scandir(dirpath)
+        except OSError:
+            return  # same as os.walk(): unreadable dirs are silently skipped
+        with it:
+            while True:
+                # Like os.walk(): an error while listing skips the rest of this dir.
+                try:
+                    entry = next(it)
+                except StopIteration:
+                    break
+                except OSError:
+                    return
+
+                name = entry.name
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+
+                if is_dir:
+                    # Like os.walk(followlinks=False): symlinked dirs are never entered.
+                    if name in exclude_dirs:
+                        continue
+                    if name == STATE_SHARD_DIR and os.path.normcase(entry.path) == own_shard_dir:
+                        continue
+                    try:
+                        is_symlink = entry.is_symlink()
+                    except OSError:
+                        return
+                    if not is_symlink:
+                        _scan(entry.path)
+                    continue
+
+                if allow_file(name):
+                    try:
+                        size = entry.stat().st_size
+                    except OSError:
+                        size = 0
+                    rel = rel_posix(entry.path)
+                    out[rel] = (rel, entry.path, size)
 
     for base_path in base_dirs_abs:
         if not os.path.exists(base_path):
+            stamps.append((base_path, _path_stamp(base_path, own_dir)))
             continue
 
         if os.path.isfile(base_path):
-            if allow_file(base_path):
-                rel = os.path.relpath(base_path, rel_root)
-                out.add(_to_posix(rel))
+            stamps.append((base_path, _path_stamp(base_path, own_dir)))
+            if allow_file(os.path.basename(base_path)):
+                try:
+                    size = os.stat(base_path).st_size
+                except OSError:
+                    size = 0
+                rel = rel_posix(base_path)
+                out[rel] = (rel, base_path, size)
             continue
 
-        for cur, dirnames, filenames in os.walk(base_path):
-            dirnames[:] = [d for d in dirnames if d not in EXCLUDE_DIRS]
-            for fn in filenames:
-                full = os.path.join(cur, fn)
-                if allow_file(full):
-                    rel = os.path.relpath(full, rel_root)
-                    out.add(_to_posix(rel))
+        _scan(base_path)
 
-    return sorted(out)
+    files = [out[rel] for rel in sorted(out)]
+    if use_cache:
+        save_scan_cache(base_dirs_abs, rel_root, stamps, files)
+    return files
 
 
 def next_undone_index(done: list[bool], start: int = 0) -> int | None:
@@ -318,36 +511,174 @@ def atomic_write_text(path: str, data: str, encoding: str = "utf-8") -> None:
     os.replace(tmp, path)
 
 
+def atomic_write_bytes(path: str, data: bytes) -> None:
+    """
+    Same as atomic_write_text, for data that is already encoded.
+    """
+    tmp = f"{path}.tmp.{os.getpid()}"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def _json_dumps_bytes(obj: object) -> bytes:
+    """
+    Compact UTF-8 JSON. Uses orjson when available, stdlib json otherwise.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
 def atomic_write_json(path: str, obj: object) -> None:
-    data = json.dumps(obj, ensure_ascii=False, indent=2)
-    atomic_write_text(path, data, encoding="utf-8")
+    atomic_write_bytes(path, _json_dumps_bytes(obj))
+
+
+def _state_fingerprint(files: list[str], scan_dirs_abs: list[str], rel_root: str) -> str:
+    """
+    Hash of the session setup (scan roots, rel_root, file list) so a saved
+    state can be matched against the current scan with one comparison.
+    NUL can't appear in paths, so it separates entries and groups unambiguously.
+    """
+    key = "\0".join(scan_dirs_abs) + "\0\0" + rel_root + "\0\0" + "\0".join(files)
+    return hashlib.blake2b(key.encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+
+
+def _shard_name(rel_posix: str) -> str:
+    h = hashlib.sha1(rel_posix.encode("utf-8", "surrogatepass")).hexdigest()
+    return f"{h[:2]}/{h[2:]}.txt"  # Two-level fan-out keeps directories small
 
 
-def save_state(
+def write_state_shard(rel_posix: str, content: str) -> str:
+    """
+    Persist one captured file's content under STATE_SHARD_DIR.
+    Returns the shard name recorded in the state manifest.
+    """
+    name = _shard_name(rel_posix)
+    shard_path = os.path.join(STATE_SHARD_DIR, _from_posix(name))
+    os.makedirs(os.path.dirname(shard_path), exist_ok=True)
+    atomic_write_text(shard_path, content, encoding="utf-8")
+    return name
+
+
+def clear_state_shards() -> None:
+    shutil.rmtree(STATE_SHARD_DIR, ignore_errors=True)
+
+
+class ShardContents(Mapping[str, str]):
+    """
+    Read-only rel_posix -> content view over a shard manifest.
+    Each body is read from disk only when accessed, e.g. while streaming
+    the bundle, so a session's contents never have to sit in memory at once.
+    A missing or unreadable shard behaves like a missing key.
+    """
+
+    def __init__(self, shards: dict[str, str]) -> None:
+        self.shards = shards
+
+    def __getitem__(self, rel_posix: str) -> str:
+        name = self.shards[rel_posix]
+        try:
+            with open(os.path.join(STATE_SHARD_DIR, _from_posix(name)), "r", encoding="utf-8", newline="") as f:
+                return f.read()
+        except (OSError, UnicodeDecodeError):
+            raise KeyError(rel_posix) from None
+
+    def __contains__(self, rel_posix: object) -> bool:
+        return rel_posix in self.shards
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.shards)
+
+    def __len__(self) -> int:
+        return len(self.shards)
+
+
+def compact_state_snapshot(
     files: list[str],
     scan_dirs_abs: list[str],
     rel_root: str,
     done: list[bool],
-    contents: dict[str, str],
+    shards: dict[str, str],
     cursor: int,
     show_remaining_only: bool,
     mode: str,
 ) -> None:
     """
-    Persist current interactive session so the user can resume later.
+    Persist the interactive session to STATE_FILE and drop the journal,
+    whose deltas are now part of the snapshot. Contents themselves live in
+    STATE_SHARD_DIR; the snapshot only holds the path -> shard manifest.
     """
     state = {
         "generated_at": datetime.now().isoformat(timespec="seconds"),
         "scan_dirs_abs": scan_dirs_abs,
         "rel_root": rel_root,
-        "files": files,
+        "fingerprint": _state_fingerprint(files, scan_dirs_abs, rel_root),
         "done": done,
         "cursor": cursor,
         "show_remaining_only": show_remaining_only,
         "mode": mode,
-        "contents": contents,
+        "shards": shards,
     }
     atomic_write_json(STATE_FILE, state)
+    try:
+        os.remove(STATE_JOURNAL)
+    except FileNotFoundError:
+        pass
+
+
+def append_state_delta(
+    rel_posix: str | None,
+    shard: str | None,
+    cursor: int,
+    show_remaining_only: bool,
+    mode: str,
+) -> int:
+    """
+    Append one session change to STATE_JOURNAL (one JSON object per line)
+    and return the journal size in bytes.
+
+    Pass the completed file's path and shard name (from write_state_shard),
+    or None for both when only the cursor / view / mode changed.
+    """
+    delta: dict[str, object] = {
+        "cursor": cursor,
+        "show_remaining_only": show_remaining_only,
+        "mode": mode,
+    }
+    if rel_posix is not None:
+        delta["path"] = rel_posix
+        delta["shard"] = shard
+
+    line = _json_dumps_bytes(delta) + b"\n"
+    with open(STATE_JOURNAL, "ab") as f:
+        f.write(line)
+        f.flush()
+        os.fsync(f.fileno())
+        return f.tell()
+
+
+def _read_state_journal() -> list[dict]:
+    """
+    Read STATE_JOURNAL deltas in order. Stops at the first unreadable line
+    (e.g. a write torn by a crash); everything before it is still valid.
+    """
+    deltas: list[dict] = []
+    try:
+        with open(STATE_JOURNAL, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    delta = json.loads(line)
+                except ValueError:
+                    break
+                if not isinstance(delta, dict):
+                    break
+                deltas.append(delta)
+    except (FileNotFoundError, UnicodeDecodeError):
+        pass
+    return deltas
 
 
 def load_state(
@@ -357,6 +688,8 @@ def load_state(
 ) -> tuple[list[bool], dict[str, str], int, bool, str] | None:
     """
     Try to restore an existing session state if it matches the current setup.
+    The STATE_FILE snapshot is loaded first, then STATE_JOURNAL is replayed on top.
+    Returns the path -> shard manifest; shard contents are not read here.
     """
     if not os.path.exists(STATE_FILE):
         return None
@@ -364,23 +697,51 @@ def load_state(
         with open(STATE_FILE, "r", encoding="utf-8") as f:
             state = json.load(f)
 
-        if state.get("scan_dirs_abs") != scan_dirs_abs:
-            return None
-        if state.get("rel_root") != rel_root:
-            return None
-        if state.get("files") != files:
-            return None
+        fingerprint = state.get("fingerprint")
+        if fingerprint is not None:
+            if fingerprint != _state_fingerprint(files, scan_dirs_abs, rel_root):
+                return None
+        elif (
+            state.get("scan_dirs_abs") != scan_dirs_abs
+            or state.get("rel_root") != rel_root
+            or state.get("files") != files
+        ):
+            return None  # Snapshot written before fingerprints: compare the old way
 
         done = state.get("done")
-        contents = state.get("contents")
+        shards = state.get("shards")
         cursor = state.get("cursor", -1)
         show_remaining_only = state.get("show_remaining_only", False)
         mode = state.get("mode", MODE_HYBRID)
 
         if not isinstance(done, list) or len(done) != len(files):
             return None
-        if not isinstance(contents, dict):
+        index = {p: i for i, p in enumerate(files)}
+
+        # Snapshots/journals from before sharding carry the contents inline:
+        # move them into shards once.
+        if shards is None and isinstance(state.get("contents"), dict):
+            shards = {
+                k: write_state_shard(k, v)
+                for k, v in state["contents"].items()
+                if k in index and isinstance(v, str)
+            }
+        if not isinstance(shards, dict):
             return None
+
+        for delta in _read_state_journal():
+            p = delta.get("path")
+            if p in index:
+                if isinstance(delta.get("shard"), str):
+                    shards[p] = delta["shard"]
+                    done[index[p]] = True
+                elif isinstance(delta.get("content"), str):
+                    shards[p] = write_state_shard(p, delta["content"])
+                    done[index[p]] = True
+            cursor = delta.get("cursor", cursor)
+            show_remaining_only = delta.get("show_remaining_only", show_remaining_only)
+            mode = delta.get("mode", mode)
+
         if not isinstance(cursor, int):
             cursor = -1
         if not isinstance(show_remaining_only, bool):
@@ -388,11 +749,12 @@ def load_state(
         if mode not in MODES:
             mode = MODE_HYBRID
 
-        contents = {k: v for k, v in contents.items() if k in files and isinstance(v, str)}
+        # Shard names are derived from the path, so anything else is not ours.
+        shards = {k: v for k, v in shards.items() if k in index and v == _shard_name(k)}
         done = [bool(x) for x in done]
         cursor = max(-1, min(cursor, len(files) - 1))
 
-        return done, contents, cursor, show_remaining_only, mode
+        return done, shards, cursor, show_remaining_only, mode
     except Exception:
         return None
 
@@ -516,16 +878,19 @@ def capture_section(path: str, index: int, total: int, progress_step: int = 50)
 
     lines: list[str] = []
     line_count = 0
+    next_progress = progress_step
+    readline = sys.stdin.readline
 
     while True:
-        line = sys.stdin.readline()
+        line = readline()
         if line == "":
             sys.stdout.write("\r" + " " * 60 + "\r")
             sys.stdout.flush()
             print(color(f"STDIN EOF. {line_count} lines captured.", YELLOW))
             break
 
-        if line.strip() == SECTION_END_MARKER:
+        # Substring test first (C-level, no allocation); only candidate lines pay for strip().
+        if SECTION_END_MARKER in line and line.strip() == SECTION_END_MARKER:
             sys.stdout.write("\r" + " " * 60 + "\r")
             sys.stdout.flush()
             print(color(f"{line_count} lines captured for [{path}].", GREEN))
@@ -534,7 +899,8 @@ def capture_section(path: str, index: int, total: int, progress_step: int = 50)
         lines.append(line)
         line_count += 1
 
-        if line_count % progress_step == 0:
+        if line_count == next_progress:
+            next_progress += progress_step
             msg = f"Capturing... {line_count} lines"
             sys.stdout.write("\r" + msg[:60].ljust(60))
             sys.stdout.flush()
@@ -542,49 +908,112 @@ def capture_section(path: str, index: int, total: int, progress_step: int = 50)
     return "".join(lines)
 
 
-def _should_skip_autoread(abs_fp: str) -> tuple[bool, str]:
-    name = os.path.basename(abs_fp)
-    ext = os.path.splitext(name)[1].lower().lstrip(".")
+_UTF8_DECODE = codecs.getdecoder("utf-8")
+_O_READ = os.O_RDONLY | getattr(os, "O_BINARY", 0)  # O_BINARY: no newline translation on Windows
+
+
+def _read_file_bytes(fd: int, size: int, limit: int) -> bytes:
+    """
+    Read a whole open file with os.read() calls sized by the `size` hint,
+    skipping the BufferedReader layer. Reads go on until EOF (an empty read),
+    since os.read() may return fewer bytes than asked even mid-file, and a
+    file larger than the hint is read on; but never past `limit` bytes: a
+    result of `limit` bytes means "at least that big".
+    """
+    data = os.read(fd, min(size + 1, limit))
+    n = len(data)
+    if not data or n >= limit:
+        return data
+    chunks = [data]
+    while n < limit:
+        chunk = os.read(fd, min(max(size + 1 - n, 64 * 1024), limit - n))
+        if not chunk:
+            break
+        chunks.append(chunk)
+        n += len(chunk)
+    return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
+
+def _should_skip_autoread(entry: tuple[str, str, int]) -> tuple[bool, str]:
+    # Name/extension rules only. The size guard needs the file's current size,
+    # so auto_read_file applies it to the open file.
+    name = entry[0].rpartition("/")[2]
+    dot = name.rfind(".")
+    ext = name[dot + 1:].lower() if dot > 0 else ""
 
     if name in AUTO_SKIP_NAMES:
         return True, f"skip-name({name})"
     if ext in AUTO_SKIP_EXTS:
         return True, f"skip-ext(.{ext})"
 
-    try:
-        sz = os.path.getsize(abs_fp)
-        if sz > AUTO_MAX_BYTES:
-            return True, f"too-large({sz} bytes)"
-    except Exception:
-        pass
-
     return False, ""
 
 
-def auto_read_file(rel_root: str, rel_posix_path: str) -> tuple[str | None, str]:
+def auto_read_file(
+    entry: tuple[str, str, int],
+    strict_binary_check: bool = AUTO_STRICT_BINARY_CHECK,
+    fd: int | None = None,
+) -> tuple[str | None, str]:
     """
-    Try to read a file from disk (binary-safe) and decode as text.
+    Try to read a scanned file from disk (binary-safe) and decode as text.
+    `entry` is a (rel_posix, abs_path, size) tuple from generate_files().
+    Its size is only a read-size hint: it can be stale (cached scan, long
+    interactive session), so the AUTO_MAX_BYTES guard is decided on the
+    open file and the bytes actually read.
+    With strict_binary_check, buffers containing NULL bytes are rejected
+    (otherwise-ASCII buffers always are).
+    If `fd` is given it is an already-open descriptor for the file; it is
+    always closed.
     Returns (content_or_None, reason_string).
     """
-    abs_fp = os.path.join(rel_root, _from_posix(rel_posix_path))
-
-    if not os.path.exists(abs_fp):
-        return None, "not-found"
-
-    skip, why = _should_skip_autoread(abs_fp)
+    skip, why = _should_skip_autoread(entry)
     if skip:
+        if fd is not None:
+            os.close(fd)
         return None, why
 
+    size = entry[2]
     try:
-        with open(abs_fp, "rb") as f:
-            data = f.read()
+        if fd is None:
+            fd = os.open(entry[1], _O_READ)
+        try:
+            if size > AUTO_MAX_BYTES:
+                # Looked too large at scan time; confirm before skipping it.
+                size = os.fstat(fd).st_size
+                if size > AUTO_MAX_BYTES:
+                    return None, f"too-large({size} bytes)"
+            data = _read_file_bytes(fd, size, AUTO_MAX_BYTES + 1)
+        finally:
+            os.close(fd)
+    except FileNotFoundError:
+        return None, "not-found"
     except Exception as e:
         return None, f"read-failed({type(e).__name__})"
 
-    if b"\x00" in data:
+    # The file grew past the hint; the read stopped at AUTO_MAX_BYTES + 1,
+    # so only the lower bound is known.
+    if len(data) > AUTO_MAX_BYTES:
+        return None, f"too-large(>{AUTO_MAX_BYTES} bytes)"
+
+    if strict_binary_check and b"\x00" in data:
         return None, "binary-detected(NULL)"
 
-    for enc in AUTO_ENCODINGS:
+    # Most source files are plain ASCII: one C-level scan, no codec lookup.
+    # NUL is ASCII too, so a BOM-less UTF-16 file would pass here; the cheap
+    # NUL check stays on this path even when the strict scan is off.
+    if data.isascii():
+        if b"\x00" in data:
+            return None, "binary-detected(NULL)"
+        return data.decode("ascii"), "ok(ascii)"
+
+    try:
+        if data.startswith(codecs.BOM_UTF8):
+            return _UTF8_DECODE(memoryview(data)[len(codecs.BOM_UTF8):])[0], "ok(utf-8-sig)"
+        return _UTF8_DECODE(data)[0], "ok(utf-8)"
+    except UnicodeDecodeError:
+        pass
+
+    for enc in AUTO_FALLBACK_ENCODINGS:
         try:
             return data.decode(enc), f"ok({enc})"
         except Exception:
@@ -593,39 +1022,135 @@ def auto_read_file(rel_root: str, rel_posix_path: str) -> tuple[str | None, str]
     return None, "decode-failed"
 
 
+def _prefetch_fd(entry: tuple[str, str, int]) -> int | None:
+    """
+    Open a file that is about to be read and ask the kernel to start loading
+    it (POSIX_FADV_WILLNEED). Returns the fd for auto_read_file to reuse.
+    """
+    try:
+        fd = os.open(entry[1], _O_READ)
+    except OSError:
+        return None  # auto_read_file will open it again and report why
+    try:
+        os.posix_fadvise(fd, 0, entry[2], os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    return fd
+
+
+def _auto_read_batch(batch: list[tuple[str, str, int]]) -> list[tuple[str | None, str]]:
+    if AUTO_PREFETCH_DEPTH <= 0 or len(batch) < 2 or not hasattr(os, "posix_fadvise"):
+        return [auto_read_file(e) for e in batch]
+
+    # Keep the next AUTO_PREFETCH_DEPTH files (i+1 ..) hinted while file i is
+    # read and decoded, so their disk reads overlap with our CPU work. File i
+    # itself is never hinted: it reuses its prefetched fd, or auto_read_file
+    # opens it.
+    readable = [not _should_skip_autoread(e)[0] and e[2] <= AUTO_MAX_BYTES for e in batch]
+    fds: dict[int, int | None] = {}
+    results: list[tuple[str | None, str]] = []
+    try:
+        for i, e in enumerate(batch):
+            for j in range(i + 1, min(i + AUTO_PREFETCH_DEPTH + 1, len(batch))):
+                if readable[j] and j not in fds:
+                    fds[j] = _prefetch_fd(batch[j])
+            results.append(auto_read_file(e, fd=fds.pop(i, None)))
+    finally:
+        for fd in fds.values():
+            if fd is not None:
+                os.close(fd)
+    return results
+
+
+def auto_read_all(
+    entries: list[tuple[str, str, int]],
+    progress_step: int = 50,
+) -> tuple[dict[str, str], dict[str, str]]:
+    """
+    Auto-read every scanned file (AUTO mode) on a thread pool.
+
+    Reads are IO-bound and release the GIL, so several are kept in flight.
+    Files are submitted in batches of up to AUTO_READ_BATCH, one submit per
+    batch, so pool overhead doesn't scale with the file count. Results are
+    only collected on the calling thread.
+
+    Returns (contents, skipped) keyed by rel_posix path.
+    """
+    contents: dict[str, str] = {}
+    skipped: dict[str, str] = {}
+    total = len(entries)
+
+    # Small trees still get one file per submit so every worker has work.
+    batch_size = max(1, min(AUTO_READ_BATCH, total // (AUTO_READ_WORKERS * 4)))
+    batches = [entries[i:i + batch_size] for i in range(0, total, batch_size)]
+
+    n_read = 0
+    with ThreadPoolExecutor(max_workers=AUTO_READ_WORKERS) as ex:
+        futures = {ex.submit(_auto_read_batch, b): b for b in batches}
+        for fut in as_completed(futures):
+            batch = futures[fut]
+            for (p, _, _), (c, why) in zip(batch, fut.result()):
+                if c is None:
+                    skipped[p] = why
+                else:
+                    contents[p] = c
+
+            prev = n_read
+            n_read += len(batch)
+            if n_read // progress_step > prev // progress_step:
+                print(color(f"Reading... {n_read}/{total}", DIM))
+
+    return contents, skipped
+
+
 def cycle_mode(mode: str) -> str:
     i = MODES.index(mode) if mode in MODES else 0
     return MODES[(i + 1) % len(MODES)]
 
 
-def build_bundle_text(rel_root: str, files: list[str], contents: dict[str, str], skipped: dict[str, str]) -> str:
+def write_bundle_stream(
+    path: str,
+    rel_root: str,
+    files: list[str],
+    contents: Mapping[str, str],
+    skipped: dict[str, str],
+    consume: bool = False,
+) -> None:
     """
-    Assemble the final bundle.txt contents.
+    Write the final bundle.txt section by section instead of joining it in
+    memory first. Uses the same temp file + atomic replace as atomic_write_text.
+
+    `contents` may be a plain dict or a lazy ShardContents. With consume=True
+    (dict only) each body is popped once written, so memory is released as
+    the bundle is streamed out.
     """
-    parts: list[str] = []
-    parts.append(f"=== BUNDLE GENERATED: {datetime.now().isoformat(timespec='seconds')} ===\n")
-    parts.append(f"=== REL_ROOT: {rel_root} ===\n")
+    tmp = f"{path}.tmp.{os.getpid()}"
+    with open(tmp, "w", encoding="utf-8", newline="") as f:
+        f.write(f"=== BUNDLE GENERATED: {datetime.now().isoformat(timespec='seconds')} ===\n")
+        f.write(f"=== REL_ROOT: {rel_root} ===\n")
 
-    if skipped:
-        parts.append("=== SKIPPED (auto-read) ===\n")
-        for p, why in sorted(skipped.items()):
-            parts.append(f"- {p} :: {why}\n")
-        parts.append("\n")
+        if skipped:
+            f.write("=== SKIPPED (auto-read) ===\n")
+            for p, why in sorted(skipped.items()):
+                f.write(f"- {p} :: {why}\n")
+            f.write("\n")
 
-    parts.append("\n")
+        f.write("\n")
 
-    for path in files:
-        if path not in contents:
-            continue
-        parts.append(HEADER_FMT.format(path=path))
-        body = contents[path]
-        parts.append(body)
-        if body and not body.endswith("\n"):
-            parts.append("\n")
-        parts.append(FOOTER_FMT.format(path=path))
-        parts.append(SECTION_GAP)
+        for p in files:
+            body = contents.pop(p, None) if consume else contents.get(p)
+            if body is None:
+                continue
+            f.write(HEADER_FMT.format(path=p))
+            f.write(body)
+            if body and not body.endswith("\n"):
+                f.write("\n")
+            f.write(FOOTER_FMT.format(path=p))
+            f.write(SECTION_GAP)
 
-    return "".join(parts)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
 
 
 def main() -> int:
@@ -639,7 +1164,8 @@ def main() -> int:
     scan_dirs_abs = normalize_base_dirs(scan_dirs_raw)
     rel_root = compute_rel_root(scan_dirs_abs)
 
-    files = generate_files(scan_dirs_abs)
+    entries = generate_files(scan_dirs_abs)
+    files = [e[0] for e in entries]
     if not files:
         print(color("No files found to scan.", RED))
         print(color("Check:", YELLOW), "are the paths correct? is the extension in ALLOWED_EXTS?")
@@ -653,24 +1179,13 @@ def main() -> int:
         print(color("AUTO mode: reading files directly and building bundle.", BOLD))
         print(color("No copy-paste. Just build.", DIM))
 
-        contents: dict[str, str] = {}
-        skipped: dict[str, str] = {}
+        contents, skipped = auto_read_all(entries)
 
-        for i, p in enumerate(files, start=1):
-            c, why = auto_read_file(rel_root, p)
-            if c is None:
-                skipped[p] = why
-                continue
-            contents[p] = c
-
-            if i % 50 == 0:
-                print(color(f"Reading... {i}/{len(files)}", DIM))
-
-        bundle_text = build_bundle_text(rel_root, files, contents, skipped)
-        atomic_write_text(BUNDLE_NAME, bundle_text, encoding="utf-8")
+        included = len(contents)
+        write_bundle_stream(BUNDLE_NAME, rel_root, files, contents, skipped, consume=True)
 
         print()
-        print(color(f"Done. Created: {BUNDLE_NAME} | Included: {len(contents)}/{len(files)}", BOLD))
+        print(color(f"Done. Created: {BUNDLE_NAME} | Included: {included}/{len(files)}", BOLD))
         if skipped:
             print(color("Skipped files:", YELLOW))
             for p, why in sorted(skipped.items()):
@@ -684,13 +1199,13 @@ def main() -> int:
     # =========================
     done = [False] * len(files)
     show_remaining_only = False
-    contents: dict[str, str] = {}
+    shards: dict[str, str] = {}  # rel_posix -> shard name under STATE_SHARD_DIR
     cursor = -1
     next_action_override: str | None = None  # "a" or "p"
 
     loaded = load_state(files, scan_dirs_abs, rel_root)
     if loaded is not None:
-        done, contents, cursor, show_remaining_only, saved_mode = loaded
+        done, shards, cursor, show_remaining_only, saved_mode = loaded
         # If you want, you can respect saved_mode instead of current mode.
         # For now, we keep the mode the user just picked.
         print(color("Bundle Maker resume: existing state loaded.", BOLD))
@@ -698,6 +1213,10 @@ def main() -> int:
     else:
         print(color("Bundle Maker started.", BOLD))
         print("This is the real workflow.\n")
+        # Journal deltas only apply on top of a snapshot of this exact setup,
+        # and shards from any previous session are stale.
+        clear_state_shards()
+        compact_state_snapshot(files, scan_dirs_abs, rel_root, done, shards, cursor, show_remaining_only, mode)
 
     try:
         while True:
@@ -718,12 +1237,12 @@ def main() -> int:
 
             if cmd.lower() == "r":
                 show_remaining_only = not show_remaining_only
-                save_state(files, scan_dirs_abs, rel_root, done, contents, cursor, show_remaining_only, mode)
+                append_state_delta(None, None, cursor, show_remaining_only, mode)
                 continue
 
             if cmd.lower() == "m":
                 mode = cycle_mode(mode)
-                save_state(files, scan_dirs_abs, rel_root, done, contents, cursor, show_remaining_only, mode)
+                append_state_delta(None, None, cursor, show_remaining_only, mode)
                 continue
 
             if cmd.lower() == "a":
@@ -783,7 +1302,7 @@ def main() -> int:
 
             # Execute action
             if action == "a":
-                content, why = auto_read_file(rel_root, path)
+                content, why = auto_read_file(entries[idx])
                 if content is None:
                     print()
                     print(color(f"[{path}] AUTO-READ failed/skipped: {why}", YELLOW))
@@ -795,28 +1314,30 @@ def main() -> int:
                             continue
                     else:
                         continue
-                contents[path] = content
+                shards[path] = write_state_shard(path, content)
                 done[idx] = True
                 cursor = idx
                 print(color(f"\n[{path}] AUTO-READ complete.", GREEN))
 
             else:  # action == "p"
                 content = capture_section(path, idx, len(files))
-                contents[path] = content
+                shards[path] = write_state_shard(path, content)
                 done[idx] = True
                 cursor = idx
                 print(color(f"\n[{path}] PASTE capture complete.", GREEN))
 
-            save_state(files, scan_dirs_abs, rel_root, done, contents, cursor, show_remaining_only, mode)
-            print(color(f"(autosaved -> {STATE_FILE})", DIM))
+            journal_size = append_state_delta(path, shards[path], cursor, show_remaining_only, mode)
+            if journal_size > STATE_JOURNAL_MAX_BYTES:
+                compact_state_snapshot(files, scan_dirs_abs, rel_root, done, shards, cursor, show_remaining_only, mode)
+            print(color(f"(autosaved -> {STATE_JOURNAL})", DIM))
 
     except KeyboardInterrupt:
         print()
         print(color("KeyboardInterrupt detected. Saving state and exiting.", YELLOW))
-        save_state(files, scan_dirs_abs, rel_root, done, contents, cursor, show_remaining_only, mode)
 
-    bundle_text = build_bundle_text(rel_root, files, contents, skipped={})
-    atomic_write_text(BUNDLE_NAME, bundle_text, encoding="utf-8")
+    compact_state_snapshot(files, scan_dirs_abs, rel_root, done, shards, cursor, show_remaining_only, mode)
+
+    write_bundle_stream(BUNDLE_NAME, rel_root, files, ShardContents(shards), skipped={})
 
     done_count = sum(1 for x in done if x)
     print()
@@ -0,0 +1,92 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bundlemaker  # noqa: E402
+
+
+class ScanCacheInScannedFolderTest(unittest.TestCase):
+    """
+    Default setup: BundleMaker runs in the folder it scans, so its own outputs
+    (bundle.txt, state files, shards, the scan cache itself) land in a scanned dir.
+    """
+
+    def setUp(self) -> None:
+        self._old_cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = os.path.realpath(self._tmp.name)
+        os.chdir(self.root)
+        os.makedirs("src")
+        with open("app.py", "w", encoding="utf-8") as f:
+            f.write("print(1)\n")
+        with open(os.path.join("src", "util.py"), "w", encoding="utf-8") as f:
+            f.write("x = 1\n")
+
+    def tearDown(self) -> None:
+        os.chdir(self._old_cwd)
+        self._tmp.cleanup()
+
+    def _simulate_run_outputs(self, files: list[str]) -> None:
+        contents = {p: "body\n" for p in files}
+        shards = {p: bundlemaker.write_state_shard(p, c) for p, c in contents.items()}
+        bundlemaker.compact_state_snapshot(files, [self.root], self.root, [True] * len(files), shards, 0, False, "hybrid")
+        bundlemaker.append_state_delta(None, None, 0, True, "hybrid")
+        bundlemaker.write_bundle_stream(bundlemaker.BUNDLE_NAME, self.root, files, contents, {})
+
+    def test_second_run_hits_cache(self) -> None:
+        first = bundlemaker.generate_files([self.root])
+        self._simulate_run_outputs([e[0] for e in first])
+
+        cached = bundlemaker.load_scan_cache([self.root], self.root)
+        self.assertIsNotNone(cached)
+        self.assertEqual(cached, first)
+        self.assertEqual(bundlemaker.generate_files([self.root]), first)
+
+    def test_new_file_invalidates_cache(self) -> None:
+        bundlemaker.generate_files([self.root])
+        with open("new.py", "w", encoding="utf-8") as f:
+            f.write("y = 2\n")
+
+        self.assertIsNone(bundlemaker.load_scan_cache([self.root], self.root))
+        rels = [e[0] for e in bundlemaker.generate_files([self.root])]
+        self.assertIn("new.py", rels)
+
+    def test_undecodable_filename_skips_cache(self) -> None:
+        try:
+            with open(b"caf\xe9.py", "wb") as f:
+                f.write(b"z = 3\n")
+        except (OSError, ValueError):
+            self.skipTest("filesystem rejects non-UTF-8 names")
+
+        for use_orjson in (True, False):
+            with self.subTest(orjson=use_orjson):
+                saved = bundlemaker.orjson
+                if not use_orjson:
+                    bundlemaker.orjson = None
+                try:
+                    rels = [e[0] for e in bundlemaker.generate_files([self.root])]
+                finally:
+                    bundlemaker.orjson = saved
+                self.assertIn(os.fsdecode(b"caf\xe9.py"), rels)
+                self.assertFalse(os.path.exists(bundlemaker.SCAN_CACHE_FILE))
+
+    def test_only_own_shard_dir_is_pruned(self) -> None:
+        bundlemaker.write_state_shard("app.py", "body\n")
+        os.makedirs(os.path.join(bundlemaker.STATE_SHARD_DIR, "ab"), exist_ok=True)
+        with open(os.path.join(bundlemaker.STATE_SHARD_DIR, "ab", "leak.py"), "w", encoding="utf-8") as f:
+            f.write("z = 3\n")
+        user_dir = os.path.join("src", bundlemaker.STATE_SHARD_DIR)
+        os.makedirs(user_dir)
+        with open(os.path.join(user_dir, "mine.py"), "w", encoding="utf-8") as f:
+            f.write("w = 4\n")
+
+        rels = [e[0] for e in bundlemaker.generate_files([self.root], use_cache=False)]
+        self.assertIn(f"src/{bundlemaker.STATE_SHARD_DIR}/mine.py", rels)
+        self.assertFalse(any(r.startswith(bundlemaker.STATE_SHARD_DIR + "/") for r in rels))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bundlemaker  # noqa: E402
+
+
+class LoadStateTest(unittest.TestCase):
+    """
+    Session restore: STATE_FILE snapshot plus the STATE_JOURNAL deltas on top,
+    including state files written before contents moved into shards.
+    """
+
+    FILES = ["a.py", "src/b.py", "src/c.py"]
+
+    def setUp(self) -> None:
+        self._old_cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = os.path.realpath(self._tmp.name)
+        os.chdir(self.root)
+        self.scan_dirs = [self.root]
+
+    def tearDown(self) -> None:
+        os.chdir(self._old_cwd)
+        self._tmp.cleanup()
+
+    def _load(self) -> tuple[list[bool], dict[str, str], int, bool, str]:
+        state = bundlemaker.load_state(self.FILES, self.scan_dirs, self.root)
+        self.assertIsNotNone(state)
+        return state
+
+    def _write_journal(self, deltas: list[dict], tail: str = "") -> None:
+        with open(bundlemaker.STATE_JOURNAL, "w", encoding="utf-8") as f:
+            for delta in deltas:
+                f.write(json.dumps(delta) + "\n")
+            f.write(tail)
+
+    def test_journal_replayed_over_snapshot(self) -> None:
+        shards = {"a.py": bundlemaker.write_state_shard("a.py", "A\n")}
+        bundlemaker.compact_state_snapshot(
+            self.FILES, self.scan_dirs, self.root, [True, False, False], shards, 0, False, bundlemaker.MODE_HYBRID
+        )
+        shard_b = bundlemaker.write_state_shard("src/b.py", "B\n")
+        bundlemaker.append_state_delta("src/b.py", shard_b, 1, False, bundlemaker.MODE_HYBRID)
+        bundlemaker.append_state_delta(None, None, 1, True, bundlemaker.MODE_PASTE)
+        # A write torn by a crash: ignored, everything before it still counts.
+        with open(bundlemaker.STATE_JOURNAL, "a", encoding="utf-8") as f:
+            f.write('{"path": "src/c.py", "sha')
+
+        done, shards, cursor, show_remaining_only, mode = self._load()
+        self.assertEqual(done, [True, True, False])
+        self.assertEqual(dict(bundlemaker.ShardContents(shards)), {"a.py": "A\n", "src/b.py": "B\n"})
+        self.assertEqual(cursor, 1)
+        self.assertTrue(show_remaining_only)
+        self.assertEqual(mode, bundlemaker.MODE_PASTE)
+
+    def test_pre_shard_state_is_migrated(self) -> None:
+        # Snapshot from before fingerprints and shards: file list and contents inline.
+        legacy = {
+            "scan_dirs_abs": self.scan_dirs,
+            "rel_root": self.root,
+            "files": self.FILES,
+            "done": [True, False, False],
+            "cursor": 0,
+            "show_remaining_only": False,
+            "mode": bundlemaker.MODE_HYBRID,
+            "contents": {"a.py": "A\n", "gone.py": "stale\n"},
+        }
+        with open(bundlemaker.STATE_FILE, "w", encoding="utf-8") as f:
+            json.dump(legacy, f)
+        self._write_journal([{"path": "src/c.py", "content": "C\n", "cursor": 2, "mode": bundlemaker.MODE_AUTO}])
+
+        done, shards, cursor, show_remaining_only, mode = self._load()
+        self.assertEqual(done, [True, False, True])
+        self.assertEqual(set(shards), {"a.py", "src/c.py"})
+        self.assertEqual(dict(bundlemaker.ShardContents(shards)), {"a.py": "A\n", "src/c.py": "C\n"})
+        self.assertEqual(cursor, 2)
+        self.assertFalse(show_remaining_only)
+        self.assertEqual(mode, bundlemaker.MODE_AUTO)
+        self.assertTrue(os.path.isdir(bundlemaker.STATE_SHARD_DIR))
+
+    def test_other_setup_is_not_restored(self) -> None:
+        bundlemaker.compact_state_snapshot(
+            self.FILES, self.scan_dirs, self.root, [False] * 3, {}, -1, False, bundlemaker.MODE_HYBRID
+        )
+        self.assertIsNone(bundlemaker.load_state(self.FILES[:2], self.scan_dirs, self.root))
+
+
+if __name__ == "__main__":
+    unittest.main()